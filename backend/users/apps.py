@@ -19,3 +19,7 @@ class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'users'
     verbose_name = 'User Management'
+    
+    def ready(self):
+        """Register the app's system checks."""
+        from . import checks  # noqa: F401
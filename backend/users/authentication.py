@@ -0,0 +1,62 @@
+"""
+Authentication classes for users app.
+
+This module extends SimpleJWT's JWTAuthentication to reject access
+tokens that were revoked on logout.
+"""
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+
+from .tokens import is_token_denied, is_token_version_current
+
+
+class RevocableJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that honours the token denylist.
+
+    After the standard signature and expiry checks, the access token's
+    jti is looked up in the cache-backed denylist (a single cache GET).
+    The token's version is then compared against the user loaded for the
+    request, which costs no extra query.
+    """
+
+    def get_validated_token(self, raw_token: bytes):
+        """
+        Validate the raw token and make sure it has not been revoked.
+
+        Args:
+            raw_token: The encoded JWT from the Authorization header.
+
+        Returns:
+            Token: The validated access token.
+
+        Raises:
+            InvalidToken: If the token is invalid, expired, or revoked.
+        """
+        validated_token = super().get_validated_token(raw_token)
+
+        if is_token_denied(validated_token):
+            raise InvalidToken('Token is blacklisted')
+
+        return validated_token
+
+    def get_user(self, validated_token):
+        """
+        Load the token's user and make sure the token has not been revoked.
+
+        Args:
+            validated_token: The validated access token.
+
+        Returns:
+            User: The authenticated user.
+
+        Raises:
+            AuthenticationFailed: If the user's tokens have been revoked.
+        """
+        user = super().get_user(validated_token)
+
+        if not is_token_version_current(validated_token, user):
+            raise AuthenticationFailed('Token has been revoked.', code='token_revoked')
+
+        return user
@@ -0,0 +1,32 @@
+"""
+System checks for users app.
+
+This module registers deployment checks, run with
+`python manage.py check --deploy`.
+"""
+
+from django.conf import settings
+from django.core.checks import Warning, register
+
+
+W001 = Warning(
+    "REDIS_URL is not set: the JWT denylist uses a per-process memory "
+    "cache, so logouts are not shared between workers.",
+    hint="Set REDIS_URL so every worker shares the same denylist.",
+    id='users.W001',
+)
+
+
+@register('caches', deploy=True)
+def check_shared_denylist_cache(app_configs, **kwargs):
+    """
+    Warn when production runs without a shared token denylist.
+    
+    Without REDIS_URL the denylist lives in a per-process memory cache,
+    so a logout handled by one worker does not revoke tokens in the
+    others.
+    
+    Returns:
+        list: The warnings found.
+    """
+    return [] if settings.REDIS_URL else [W001]
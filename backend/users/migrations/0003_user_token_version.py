@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-14 03:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_user_name_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='token_version',
+            field=models.PositiveIntegerField(default=0, help_text='Incremented to revoke all previously issued tokens.', verbose_name='Token Version'),
+        ),
+    ]
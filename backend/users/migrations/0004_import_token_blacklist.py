@@ -0,0 +1,103 @@
+"""
+Copy SimpleJWT's database blacklist into the cache-backed token denylist.
+
+The token_blacklist app is no longer installed, so refresh tokens it had
+blacklisted would become valid again. This migration reads the leftover
+tables directly and denies every blacklisted jti that has not expired
+yet. It is a no-op when the tables do not exist, and it refuses to run
+against a per-process memory cache unless DEBUG is on.
+"""
+
+import logging
+import math
+from collections import defaultdict
+from datetime import timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import migrations
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+
+logger = logging.getLogger(__name__)
+
+OUTSTANDING_TABLE = 'token_blacklist_outstandingtoken'
+BLACKLISTED_TABLE = 'token_blacklist_blacklistedtoken'
+
+# Must match users.tokens.DENYLIST_KEY_PREFIX
+DENYLIST_KEY_PREFIX = 'token_denylist:'
+
+# Timeouts are rounded up to this many seconds so that tokens expiring
+# close together are written with one set_many call
+TIMEOUT_BUCKET_SECONDS = 60 * 60
+
+
+def import_token_blacklist(apps, schema_editor):
+    """
+    Deny every unexpired refresh token from the old blacklist tables.
+    
+    Raises:
+        ImproperlyConfigured: If there are tokens to import but the default
+            cache is a per-process memory cache (and DEBUG is off), since
+            the entries would be lost when `migrate` exits.
+    """
+    connection = schema_editor.connection
+    tables = connection.introspection.table_names()
+
+    if OUTSTANDING_TABLE not in tables or BLACKLISTED_TABLE not in tables:
+        return
+
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT o.{quote('jti')}, o.{quote('expires_at')} "
+            f"FROM {quote(BLACKLISTED_TABLE)} b "
+            f"JOIN {quote(OUTSTANDING_TABLE)} o ON b.{quote('token_id')} = o.{quote('id')}"
+        )
+        rows = cursor.fetchall()
+
+    now = timezone.now()
+    buckets = defaultdict(dict)
+    for jti, expires_at in rows:
+        if isinstance(expires_at, str):
+            expires_at = parse_datetime(expires_at)
+        if timezone.is_naive(expires_at):
+            # Django stores datetimes in UTC when USE_TZ is enabled
+            expires_at = timezone.make_aware(expires_at, dt_timezone.utc)
+
+        timeout = (expires_at - now).total_seconds()
+        if timeout > 0:
+            # Keeping an entry a little past its token's expiry is harmless
+            bucket = math.ceil(timeout / TIMEOUT_BUCKET_SECONDS) * TIMEOUT_BUCKET_SECONDS
+            buckets[bucket][f"{DENYLIST_KEY_PREFIX}{jti}"] = True
+
+    if not buckets:
+        return
+
+    cache = caches['default']
+    if isinstance(cache, LocMemCache):
+        message = (
+            "The default cache is a per-process memory cache, so the %d "
+            "imported token blacklist entries are lost when migrate exits. "
+            "Set REDIS_URL before migrating."
+        ) % sum(len(entries) for entries in buckets.values())
+        if not settings.DEBUG:
+            raise ImproperlyConfigured(message)
+        logger.warning(message)
+
+    for timeout, entries in buckets.items():
+        cache.set_many(entries, timeout=timeout)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_user_token_version'),
+    ]
+
+    operations = [
+        migrations.RunPython(import_token_blacklist, migrations.RunPython.noop),
+    ]
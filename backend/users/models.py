@@ -17,12 +17,15 @@ class User(AbstractUser):
     - Unique email address
     - Optional profile picture
     - Automatic timestamps (created_at, updated_at)
+    - Token version counter for revoking all issued JWTs
     
     Attributes:
         email: Unique email address for the user (required for authentication).
         profile_picture: Optional image field for user's profile picture.
         created_at: Timestamp when the user was created.
         updated_at: Timestamp when the user was last updated.
+        token_version: Counter embedded in issued JWTs; incrementing it
+            revokes every token issued before the change.
     """
     
     email = models.EmailField(
@@ -52,6 +55,12 @@ class User(AbstractUser):
         help_text='Timestamp when the user account was last updated.'
     )
     
+    token_version = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Token Version',
+        help_text='Incremented to revoke all previously issued tokens.'
+    )
+    
     # Additional required fields for user creation
     REQUIRED_FIELDS = ['email', 'first_name', 'last_name']
     
@@ -63,10 +72,17 @@ class User(AbstractUser):
             verbose_name: Singular name for the model.
             verbose_name_plural: Plural name for the model.
             ordering: Default ordering (by creation date, newest first).
+            indexes: Indexes on name columns used by admin prefix search
+                (username and email are already indexed by their unique
+                constraints).
         """
         verbose_name = 'User'
         verbose_name_plural = 'Users'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['first_name'], name='users_first_name_idx'),
+            models.Index(fields=['last_name'], name='users_last_name_idx'),
+        ]
     
     def __str__(self) -> str:
         """
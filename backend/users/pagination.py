@@ -0,0 +1,46 @@
+"""
+Pagination classes for user management.
+
+This module contains DRF pagination classes that keep list responses
+bounded while preserving the response envelope expected by the frontend.
+"""
+
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+
+
+class UserPagination(PageNumberPagination):
+    """
+    Page number pagination for user lists.
+
+    The page size defaults to `page_size` and can be overridden per
+    request with the `page_size` query parameter, up to `max_page_size`.
+
+    Response Body:
+        - count (int): Total number of users matching the query.
+        - next (str): URL of the next page, or null.
+        - previous (str): URL of the previous page, or null.
+        - users (list): Serialized users for the current page.
+    """
+
+    page_size = 25
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def get_paginated_response(self, data):
+        """
+        Build the paginated response using the `users` envelope key.
+
+        Args:
+            data: The serialized page of users.
+
+        Returns:
+            Response: JSON response with pagination metadata and users.
+        """
+        return Response({
+            'count': self.page.paginator.count,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'users': data,
+        })
+
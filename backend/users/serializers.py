@@ -5,6 +5,8 @@ This module contains DRF serializers for:
 - User registration with validation
 - User profile data serialization
 - Login request validation
+- Logout request validation
+- Token issuance and refresh with revocation checks
 
 All serializers include comprehensive validation and meaningful error messages.
 """
@@ -15,14 +17,83 @@ from django.contrib.auth.password_validation import validate_password
 from django.core.validators import validate_email
 from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
 
 from .models import User
+from .tokens import (
+    TOKEN_VERSION_CLAIM,
+    deny_token,
+    is_token_denied,
+    is_token_version_current,
+)
 
 
 logger = logging.getLogger(__name__)
 
 
-class RegisterSerializer(serializers.ModelSerializer):
+class FullNameMixin(serializers.Serializer):
+    """
+    Serializer mixin adding a read-only `full_name` field.
+    
+    Shared by every serializer that renders user data so the field is
+    defined and computed in one place.
+    """
+    
+    full_name = serializers.SerializerMethodField()
+    
+    def get_full_name(self, obj: User) -> str:
+        """
+        Get the full name of the user.
+        
+        Args:
+            obj: The User instance.
+            
+        Returns:
+            str: The full name of the user.
+        """
+        return obj.get_full_name()
+
+
+class UserSerializer(FullNameMixin, serializers.ModelSerializer):
+    """
+    Serializer for user profile data.
+    
+    Used for returning user profile information without sensitive data.
+    Includes read-only fields that cannot be modified through this serializer.
+    """
+    
+    class Meta:
+        model = User
+        fields = [
+            'id',
+            'username',
+            'email',
+            'first_name',
+            'last_name',
+            'full_name',
+            'profile_picture',
+            'is_staff',
+            'is_superuser',
+            'created_at',
+            'updated_at',
+        ]
+        read_only_fields = [
+            'id',
+            'username',
+            'email',
+            'is_staff',
+            'is_superuser',
+            'created_at',
+            'updated_at',
+        ]
+
+
+class RegisterSerializer(FullNameMixin, serializers.ModelSerializer):
     """
     Serializer for user registration.
     
@@ -33,6 +104,9 @@ class RegisterSerializer(serializers.ModelSerializer):
     - Password confirmation (must match password)
     - First name and last name (required)
     
+    The serialized output uses UserSerializer's fields, so the registration
+    response can be built from this serializer without a second pass.
+    
     Attributes:
         password: Write-only password field.
         password2: Write-only password confirmation field.
@@ -54,22 +128,19 @@ class RegisterSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = User
-        fields = [
-            'id',
-            'username',
-            'email',
-            'first_name',
-            'last_name',
-            'password',
-            'password2',
-        ]
+        fields = UserSerializer.Meta.fields + ['password', 'password2']
         extra_kwargs = {
             'first_name': {'required': True},
             'last_name': {'required': True},
             'email': {'required': True},
             'username': {'required': True},
         }
-        read_only_fields = ['id']
+        # Only the registration inputs are writable; everything else
+        # rendered by UserSerializer is read-only here
+        read_only_fields = [
+            field for field in UserSerializer.Meta.fields
+            if field not in ('username', 'email', 'first_name', 'last_name', 'full_name')
+        ]
     
     def validate_username(self, value: str) -> str:
         """
@@ -271,60 +342,12 @@ class RegisterSerializer(serializers.ModelSerializer):
         # Save user to database
         user.save()
         
-        logger.info(f"New user registered: {user.username}")
+        logger.info("New user registered: %s", user.username)
         
         return user
 
 
-class UserSerializer(serializers.ModelSerializer):
-    """
-    Serializer for user profile data.
-    
-    Used for returning user profile information without sensitive data.
-    Includes read-only fields that cannot be modified through this serializer.
-    """
-    
-    full_name = serializers.SerializerMethodField()
-    
-    class Meta:
-        model = User
-        fields = [
-            'id',
-            'username',
-            'email',
-            'first_name',
-            'last_name',
-            'full_name',
-            'profile_picture',
-            'is_staff',
-            'is_superuser',
-            'created_at',
-            'updated_at',
-        ]
-        read_only_fields = [
-            'id',
-            'username',
-            'email',
-            'is_staff',
-            'is_superuser',
-            'created_at',
-            'updated_at',
-        ]
-    
-    def get_full_name(self, obj: User) -> str:
-        """
-        Get the full name of the user.
-        
-        Args:
-            obj: The User instance.
-            
-        Returns:
-            str: The full name of the user.
-        """
-        return obj.get_full_name()
-
-
-class AdminUserSerializer(serializers.ModelSerializer):
+class AdminUserSerializer(FullNameMixin, serializers.ModelSerializer):
     """
     Serializer for admin user management.
     
@@ -332,8 +355,6 @@ class AdminUserSerializer(serializers.ModelSerializer):
     Includes all user fields that admins should be able to see and modify.
     """
     
-    full_name = serializers.SerializerMethodField()
-    
     class Meta:
         model = User
         fields = [
@@ -358,21 +379,27 @@ class AdminUserSerializer(serializers.ModelSerializer):
             'is_superuser',  # Only superusers can modify this via Django admin
         ]
     
-    def get_full_name(self, obj: User) -> str:
-        """Get the full name of the user."""
-        return obj.get_full_name()
-    
     def validate_username(self, value: str) -> str:
         """Validate username for updates."""
         instance = self.instance
-        if instance and User.objects.filter(username__iexact=value).exclude(pk=instance.pk).exists():
+        # Skip the lookup when the username is unchanged
+        if (
+            instance
+            and value.lower() != instance.username.lower()
+            and User.objects.filter(username__iexact=value).exclude(pk=instance.pk).exists()
+        ):
             raise serializers.ValidationError("A user with that username already exists.")
         return value.lower()
     
     def validate_email(self, value: str) -> str:
         """Validate email for updates."""
         instance = self.instance
-        if instance and User.objects.filter(email__iexact=value).exclude(pk=instance.pk).exists():
+        # Skip the lookup when the email is unchanged
+        if (
+            instance
+            and value.lower() != instance.email.lower()
+            and User.objects.filter(email__iexact=value).exclude(pk=instance.pk).exists()
+        ):
             raise serializers.ValidationError("A user with this email already exists.")
         return value.lower()
 
@@ -437,3 +464,153 @@ class LoginSerializer(serializers.Serializer):
             )
         
         return value
+
+
+class LogoutSerializer(serializers.Serializer):
+    """
+    Serializer for logout request validation.
+    
+    Accepts a single refresh token, a list of refresh tokens, or the
+    `all_devices` flag. `refresh` and `refresh_tokens` may be combined;
+    the validated data always holds the merged, deduplicated
+    `refresh_tokens` (empty when logging out from all devices or when no
+    refresh token was given).
+    """
+    
+    MAX_REFRESH_TOKENS = 20
+    
+    refresh = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        allow_null=True,
+        help_text='The refresh token to revoke.'
+    )
+    
+    refresh_tokens = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        min_length=1,
+        max_length=MAX_REFRESH_TOKENS,
+        help_text='Several refresh tokens to revoke at once.'
+    )
+    
+    all_devices = serializers.BooleanField(
+        required=False,
+        default=False,
+        help_text='Revoke every token issued to the user.'
+    )
+    
+    def validate(self, attrs: dict) -> dict:
+        """
+        Merge `refresh` into `refresh_tokens`.
+        
+        A missing refresh token is not an error here; the view reports it
+        so the response keeps its original shape.
+        
+        Args:
+            attrs: Dictionary of field values.
+            
+        Returns:
+            dict: The validated attributes with `refresh_tokens` filled in.
+            
+        Raises:
+            ValidationError: If more than MAX_REFRESH_TOKENS distinct
+                refresh tokens were provided.
+        """
+        if attrs['all_devices']:
+            attrs['refresh_tokens'] = []
+            return attrs
+        
+        refresh_tokens = list(attrs.get('refresh_tokens', []))
+        if attrs.get('refresh'):
+            refresh_tokens.append(attrs['refresh'])
+        
+        # Deduplicate while keeping the request order
+        refresh_tokens = list(dict.fromkeys(refresh_tokens))
+        
+        if len(refresh_tokens) > self.MAX_REFRESH_TOKENS:
+            raise serializers.ValidationError({
+                'refresh_tokens': (
+                    f"Ensure this field has no more than "
+                    f"{self.MAX_REFRESH_TOKENS} elements."
+                )
+            })
+        
+        attrs['refresh_tokens'] = refresh_tokens
+        return attrs
+
+
+class VersionedTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """
+    Serializer for login (JWT token pair generation).
+    
+    Embeds the user's current token version in the refresh token, and
+    therefore in every access token derived from it.
+    """
+    
+    @classmethod
+    def get_token(cls, user: User):
+        """
+        Create a refresh token for the user.
+        
+        Args:
+            user: The authenticated user.
+            
+        Returns:
+            RefreshToken: The refresh token with the token version claim.
+        """
+        token = super().get_token(user)
+        token[TOKEN_VERSION_CLAIM] = user.token_version
+        
+        return token
+
+
+class DenylistTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Serializer for refreshing access tokens.
+    
+    Replaces SimpleJWT's database blacklist with the cache-backed token
+    denylist: revoked refresh tokens are rejected, and when refresh
+    tokens are rotated the old token is revoked before its replacement
+    is issued. Refresh tokens issued before the user's token version was
+    last incremented are rejected as well.
+    """
+    
+    def validate(self, attrs: dict) -> dict:
+        """
+        Validate the refresh token and issue new tokens.
+        
+        Args:
+            attrs: Dictionary containing the refresh token.
+            
+        Returns:
+            dict: The new access token (and refresh token when rotating).
+            
+        Raises:
+            TokenError: If the refresh token is invalid, expired, or revoked.
+        """
+        refresh = self.token_class(attrs['refresh'])
+        
+        if is_token_denied(refresh):
+            raise TokenError("Token is blacklisted")
+        
+        user = User.objects.filter(
+            **{api_settings.USER_ID_FIELD: refresh.get(api_settings.USER_ID_CLAIM)}
+        ).only('token_version').first()
+        
+        if user is None or not is_token_version_current(refresh, user):
+            raise TokenError("Token has been revoked")
+        
+        data = {'access': str(refresh.access_token)}
+        
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            # Revoke the old refresh token before reusing the object
+            deny_token(refresh)
+            
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            
+            data['refresh'] = str(refresh)
+        
+        return data
@@ -6,16 +6,33 @@ This module contains comprehensive tests for:
 - User login
 - Profile retrieval
 - Token refresh
+- Logout
+- Admin user management
 
 Uses Django's TestCase and DRF's APIClient for API testing.
 """
 
-from django.test import TestCase
+import importlib
+from datetime import timedelta
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+
+from django.apps import apps
+from django.core.cache import cache
+from django.core.checks import run_checks
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
 
+from .checks import check_shared_denylist_cache
 from .models import User
+from .serializers import UserSerializer
+from .tokens import DENYLIST_KEY_PREFIX
 
 
 class UserModelTests(TestCase):
@@ -89,12 +106,43 @@ class RegisterAPITests(TestCase):
         self.assertIn('user', response.data)
         self.assertEqual(response.data['user']['username'], 'newuser')
         self.assertEqual(response.data['user']['email'], 'newuser@example.com')
+        self.assertEqual(response.data['user']['full_name'], 'New User')
+        self.assertNotIn('password', response.data['user'])
+        self.assertNotIn('password2', response.data['user'])
         
         # Verify user was created in database
         self.assertTrue(
             User.objects.filter(username='newuser').exists()
         )
     
+    def test_register_response_matches_profile(self):
+        """Test that registration returns the same fields as the profile API."""
+        response = self.client.post(
+            self.register_url,
+            self.valid_payload,
+            format='json'
+        )
+        
+        user = User.objects.get(username='newuser')
+        self.assertEqual(response.data['user'], UserSerializer(user).data)
+    
+    def test_register_ignores_read_only_fields(self):
+        """Test that privilege fields cannot be set during registration."""
+        payload = self.valid_payload.copy()
+        payload['is_staff'] = True
+        payload['is_superuser'] = True
+        
+        response = self.client.post(
+            self.register_url,
+            payload,
+            format='json'
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        user = User.objects.get(username='newuser')
+        self.assertFalse(user.is_staff)
+        self.assertFalse(user.is_superuser)
+    
     def test_register_with_duplicate_username(self):
         """Test registration with an existing username."""
         # Create a user first
@@ -309,6 +357,37 @@ class ProfileAPITests(TestCase):
         self.assertEqual(response.data['first_name'], 'Test')
         self.assertEqual(response.data['last_name'], 'User')
     
+    def test_get_profile_not_modified(self):
+        """Test that a matching If-None-Match returns 304 without a body."""
+        token = self.get_auth_token()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        
+        response = self.client.get(self.profile_url)
+        etag = response['ETag']
+        
+        response = self.client.get(self.profile_url, HTTP_IF_NONE_MATCH=etag)
+        
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['ETag'], etag)
+    
+    def test_get_profile_modified(self):
+        """Test that the ETag changes once the profile is updated."""
+        token = self.get_auth_token()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        
+        response = self.client.get(self.profile_url)
+        etag = response['ETag']
+        
+        self.user.first_name = 'Changed'
+        self.user.save()
+        
+        response = self.client.get(self.profile_url, HTTP_IF_NONE_MATCH=etag)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['first_name'], 'Changed')
+        self.assertNotEqual(response['ETag'], etag)
+    
     def test_get_profile_without_token(self):
         """Test profile retrieval without authentication token."""
         response = self.client.get(self.profile_url)
@@ -367,6 +446,25 @@ class TokenRefreshAPITests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('access', response.data)
     
+    def test_refresh_revokes_rotated_token(self):
+        """Test that a rotated refresh token cannot be used again."""
+        _, refresh_token = self.get_tokens()
+        
+        response = self.client.post(
+            self.refresh_url,
+            {'refresh': refresh_token},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('refresh', response.data)
+        
+        response = self.client.post(
+            self.refresh_url,
+            {'refresh': refresh_token},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+    
     def test_refresh_with_invalid_token(self):
         """Test token refresh with invalid refresh token."""
         response = self.client.post(
@@ -378,6 +476,373 @@ class TokenRefreshAPITests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+class LogoutAPITests(TestCase):
+    """Test cases for the logout API."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.client = APIClient()
+        self.logout_url = reverse('users:logout')
+        self.login_url = reverse('users:login')
+        self.refresh_url = reverse('users:token_refresh')
+        
+        # Create a test user
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='TestPass123!',
+            first_name='Test',
+            last_name='User'
+        )
+    
+    def get_tokens(self):
+        """Helper method to get access and refresh tokens."""
+        response = self.client.post(
+            self.login_url,
+            {
+                'username': 'testuser',
+                'password': 'TestPass123!'
+            },
+            format='json'
+        )
+        return response.data.get('access'), response.data.get('refresh')
+    
+    def test_logout_with_valid_token(self):
+        """Test that logging out prevents the refresh token from being reused."""
+        access_token, refresh_token = self.get_tokens()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        
+        response = self.client.post(
+            self.logout_url,
+            {'refresh': refresh_token},
+            format='json'
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
+        response = self.client.post(
+            self.refresh_url,
+            {'refresh': refresh_token},
+            format='json'
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+    
+    def test_logout_revokes_access_token(self):
+        """Test that the access token used to log out is rejected afterwards."""
+        access_token, refresh_token = self.get_tokens()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        
+        self.client.post(
+            self.logout_url,
+            {'refresh': refresh_token},
+            format='json'
+        )
+        response = self.client.get(reverse('users:profile'))
+        
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+    
+    def test_logout_with_multiple_refresh_tokens(self):
+        """Test revoking several refresh tokens in one request."""
+        _, first_refresh = self.get_tokens()
+        _, second_refresh = self.get_tokens()
+        access_token, _ = self.get_tokens()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        
+        response = self.client.post(
+            self.logout_url,
+            {'refresh_tokens': [first_refresh, second_refresh]},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
+        self.client.credentials()
+        for refresh_token in (first_refresh, second_refresh):
+            response = self.client.post(
+                self.refresh_url,
+                {'refresh': refresh_token},
+                format='json'
+            )
+            self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+    
+    def test_logout_with_refresh_and_refresh_tokens(self):
+        """Test that `refresh` is revoked together with `refresh_tokens`."""
+        _, first_refresh = self.get_tokens()
+        _, second_refresh = self.get_tokens()
+        access_token, _ = self.get_tokens()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        
+        response = self.client.post(
+            self.logout_url,
+            {'refresh': first_refresh, 'refresh_tokens': [second_refresh]},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
+        self.client.credentials()
+        for refresh_token in (first_refresh, second_refresh):
+            response = self.client.post(
+                self.refresh_url,
+                {'refresh': refresh_token},
+                format='json'
+            )
+            self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+    
+    def test_logout_with_too_many_combined_refresh_tokens(self):
+        """Test that the 20 token limit applies after merging `refresh`."""
+        access_token, _ = self.get_tokens()
+        refresh_tokens = [self.get_tokens()[1] for _ in range(21)]
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        
+        response = self.client.post(
+            self.logout_url,
+            {'refresh': refresh_tokens[0], 'refresh_tokens': refresh_tokens[1:]},
+            format='json'
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('refresh_tokens', response.data)
+    
+    def test_logout_with_invalid_refresh_token_list(self):
+        """Test that one invalid token in the list rejects the whole request."""
+        access_token, refresh_token = self.get_tokens()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        
+        response = self.client.post(
+            self.logout_url,
+            {'refresh_tokens': [refresh_token, 'invalid_refresh_token']},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        
+        # Nothing was revoked
+        response = self.client.post(
+            self.refresh_url,
+            {'refresh': refresh_token},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+    
+    def test_logout_with_null_refresh_token_in_list(self):
+        """Test that non-string list items are rejected."""
+        access_token, _ = self.get_tokens()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        
+        response = self.client.post(
+            self.logout_url,
+            {'refresh_tokens': [None]},
+            format='json'
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('refresh_tokens', response.data)
+    
+    def test_logout_with_too_many_refresh_tokens(self):
+        """Test that at most 20 refresh tokens can be revoked at once."""
+        access_token, refresh_token = self.get_tokens()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        
+        response = self.client.post(
+            self.logout_url,
+            {'refresh_tokens': [refresh_token] * 21},
+            format='json'
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('refresh_tokens', response.data)
+    
+    def test_logout_with_empty_refresh_token_list(self):
+        """Test logout with an empty list of refresh tokens."""
+        access_token, _ = self.get_tokens()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        
+        response = self.client.post(
+            self.logout_url,
+            {'refresh_tokens': []},
+            format='json'
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+    
+    def test_logout_from_all_devices(self):
+        """Test that logging out from all devices revokes every issued token."""
+        other_access, other_refresh = self.get_tokens()
+        access_token, _ = self.get_tokens()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        
+        response = self.client.post(
+            self.logout_url,
+            {'all_devices': True},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
+        # Tokens from the other session no longer work
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {other_access}')
+        response = self.client.get(reverse('users:profile'))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        
+        response = self.client.post(
+            self.refresh_url,
+            {'refresh': other_refresh},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        
+        # Logging in again issues working tokens
+        self.client.credentials()
+        access_token, _ = self.get_tokens()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        response = self.client.get(reverse('users:profile'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+    
+    def test_logout_without_refresh_token(self):
+        """Test logout without providing a refresh token."""
+        access_token, _ = self.get_tokens()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        
+        response = self.client.post(self.logout_url, {}, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error'], 'Refresh token is required.')
+    
+    def test_logout_with_null_refresh_token(self):
+        """Test that a null refresh token is treated as missing."""
+        access_token, _ = self.get_tokens()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        
+        response = self.client.post(
+            self.logout_url,
+            {'refresh': None},
+            format='json'
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error'], 'Refresh token is required.')
+    
+    def test_logout_with_invalid_refresh_token(self):
+        """Test logout with an invalid refresh token."""
+        access_token, _ = self.get_tokens()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        
+        response = self.client.post(
+            self.logout_url,
+            {'refresh': 'invalid_refresh_token'},
+            format='json'
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error'], 'Invalid or expired token.')
+    
+    def test_logout_with_non_object_body(self):
+        """Test logout with a JSON body that is not an object."""
+        access_token, _ = self.get_tokens()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+        
+        response = self.client.post(self.logout_url, ['x'], format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error'], 'Request body must be a JSON object.')
+    
+    def test_logout_without_access_token(self):
+        """Test logout without authentication."""
+        response = self.client.post(
+            self.logout_url,
+            {'refresh': 'anything'},
+            format='json'
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class DenylistConfigurationTests(TestCase):
+    """Test cases for the token denylist deployment check."""
+    
+    @override_settings(REDIS_URL='')
+    def test_warns_without_redis(self):
+        """Test that the deploy check warns when there is no shared cache."""
+        warnings = check_shared_denylist_cache(None)
+        
+        self.assertEqual([warning.id for warning in warnings], ['users.W001'])
+    
+    @override_settings(REDIS_URL='redis://localhost:6379/0')
+    def test_no_warning_with_redis(self):
+        """Test that no warning is reported when Redis is configured."""
+        self.assertEqual(check_shared_denylist_cache(None), [])
+    
+    @override_settings(REDIS_URL='')
+    def test_warning_is_deploy_only(self):
+        """Test that the warning is not reported by a regular check."""
+        self.assertNotIn('users.W001', [w.id for w in run_checks()])
+        self.assertIn('users.W001', [w.id for w in run_checks(include_deployment_checks=True)])
+
+
+class TokenBlacklistImportTests(TestCase):
+    """Test cases for importing SimpleJWT's database blacklist into the cache."""
+    
+    def setUp(self):
+        """Recreate the old blacklist tables with two blacklisted tokens."""
+        now = timezone.now()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "CREATE TABLE token_blacklist_outstandingtoken "
+                "(id integer PRIMARY KEY, jti varchar(255), expires_at datetime)"
+            )
+            cursor.execute(
+                "CREATE TABLE token_blacklist_blacklistedtoken "
+                "(id integer PRIMARY KEY, token_id integer)"
+            )
+            cursor.execute(
+                "INSERT INTO token_blacklist_outstandingtoken VALUES "
+                "(1, 'live-jti', %s), (2, 'expired-jti', %s), (3, 'outstanding-jti', %s)",
+                [now + timedelta(days=1), now - timedelta(days=1), now + timedelta(days=1)]
+            )
+            cursor.execute(
+                "INSERT INTO token_blacklist_blacklistedtoken VALUES (1, 1), (2, 2)"
+            )
+    
+    def import_token_blacklist(self):
+        """Helper method to run the migration's import function."""
+        migration = importlib.import_module('users.migrations.0004_import_token_blacklist')
+        migration.import_token_blacklist(apps, SimpleNamespace(connection=connection))
+    
+    def test_import_denies_unexpired_blacklisted_tokens(self):
+        """Test that only unexpired blacklisted tokens are denied."""
+        with TemporaryDirectory() as location:
+            shared_cache = {
+                'default': {
+                    'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+                    'LOCATION': location,
+                }
+            }
+            with override_settings(CACHES=shared_cache):
+                self.import_token_blacklist()
+                
+                self.assertTrue(cache.get('token_denylist:live-jti'))
+                self.assertIsNone(cache.get('token_denylist:expired-jti'))
+                self.assertIsNone(cache.get('token_denylist:outstanding-jti'))
+    
+    @override_settings(DEBUG=False)
+    def test_import_refuses_memory_cache(self):
+        """Test that entries are not silently lost in a per-process cache."""
+        with self.assertRaises(ImproperlyConfigured):
+            self.import_token_blacklist()
+    
+    @override_settings(DEBUG=True)
+    def test_import_warns_for_memory_cache_in_debug(self):
+        """Test that development imports into the memory cache with a warning."""
+        with self.assertLogs('users.migrations', level='WARNING'):
+            self.import_token_blacklist()
+        
+        self.assertTrue(cache.get('token_denylist:live-jti'))
+    
+    def test_import_uses_denylist_key_prefix(self):
+        """Test that the migration writes the keys the denylist reads."""
+        migration = importlib.import_module('users.migrations.0004_import_token_blacklist')
+        
+        self.assertEqual(migration.DENYLIST_KEY_PREFIX, DENYLIST_KEY_PREFIX)
+
+
 class HealthCheckAPITests(TestCase):
     """Test cases for the health check API."""
     
@@ -391,4 +856,247 @@ class HealthCheckAPITests(TestCase):
         response = self.client.get(self.health_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['status'], 'healthy')
+        self.assertEqual(response.json()['status'], 'healthy')
+    
+    def test_health_check_ignores_credentials(self):
+        """Test that the health check does not authenticate requests."""
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer invalid_token')
+        
+        response = self.client.get(self.health_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+    
+    def test_health_check_rejects_post(self):
+        """Test that the health check only accepts GET requests."""
+        response = self.client.post(self.health_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+
+
+class AdminUserListAPITests(TestCase):
+    """Test cases for the admin user list API."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.client = APIClient()
+        self.list_url = reverse('users:admin_user_list')
+        
+        # Create an admin user and authenticate as them
+        self.admin = User.objects.create_user(
+            username='adminuser',
+            email='admin@example.com',
+            password='AdminPass123!',
+            first_name='Admin',
+            last_name='User',
+            is_staff=True
+        )
+        self.client.force_authenticate(user=self.admin)
+        
+        # Create regular users
+        User.objects.bulk_create([
+            User(
+                username=f'member{i}',
+                email=f'member{i}@example.com',
+                first_name='Member',
+                last_name=f'Number{i}'
+            )
+            for i in range(30)
+        ])
+    
+    def test_list_is_paginated(self):
+        """Test that the user list is split into pages."""
+        response = self.client.get(self.list_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 31)
+        self.assertEqual(len(response.data['users']), 25)
+        self.assertIsNotNone(response.data['next'])
+        self.assertIsNone(response.data['previous'])
+    
+    def test_list_second_page(self):
+        """Test retrieving the last page of users."""
+        response = self.client.get(self.list_url, {'page': 2})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['users']), 6)
+        self.assertIsNone(response.data['next'])
+    
+    def test_list_pages_are_stable_with_equal_timestamps(self):
+        """Test that users sharing created_at are neither repeated nor skipped."""
+        User.objects.update(created_at=self.admin.created_at)
+        
+        usernames = []
+        for page in (1, 2, 3, 4):
+            response = self.client.get(self.list_url, {'page': page, 'page_size': 8})
+            usernames += [u['username'] for u in response.data['users']]
+        
+        self.assertEqual(len(usernames), 31)
+        self.assertEqual(len(set(usernames)), 31)
+    
+    def test_list_with_page_size(self):
+        """Test overriding the page size with a query parameter."""
+        response = self.client.get(self.list_url, {'page_size': 5})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['users']), 5)
+    
+    def test_list_with_search(self):
+        """Test that search filtering is applied before pagination."""
+        response = self.client.get(self.list_url, {'search': 'member1'})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # member1 and member10-member19
+        self.assertEqual(response.data['count'], 11)
+    
+    def test_list_with_short_search_matches_prefix(self):
+        """Test that short search terms only match from the start of a field."""
+        response = self.client.get(self.list_url, {'search': 'nu'})
+        self.assertEqual(response.data['count'], 30)
+        
+        # 'er' appears inside 'member' and 'user' but starts no field
+        response = self.client.get(self.list_url, {'search': 'er'})
+        self.assertEqual(response.data['count'], 0)
+    
+    def test_list_counts_once(self):
+        """Test that listing users issues a single COUNT query."""
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.list_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        count_queries = [
+            q for q in context.captured_queries if 'COUNT(' in q['sql'].upper()
+        ]
+        self.assertEqual(len(count_queries), 1)
+    
+    def test_list_query_count_is_constant(self):
+        """Test that the number of queries does not grow with page size."""
+        with CaptureQueriesContext(connection) as small_page:
+            self.client.get(self.list_url, {'page_size': 5})
+        
+        with CaptureQueriesContext(connection) as large_page:
+            self.client.get(self.list_url, {'page_size': 30})
+        
+        self.assertEqual(len(small_page), len(large_page))
+    
+    def test_list_as_non_admin(self):
+        """Test that regular users cannot list users."""
+        member = User.objects.get(username='member0')
+        self.client.force_authenticate(user=member)
+        
+        response = self.client.get(self.list_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class AdminUserDetailAPITests(TestCase):
+    """Test cases for the admin user detail API."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.client = APIClient()
+        
+        # Create an admin user and authenticate as them
+        self.admin = User.objects.create_user(
+            username='adminuser',
+            email='admin@example.com',
+            password='AdminPass123!',
+            first_name='Admin',
+            last_name='User',
+            is_staff=True
+        )
+        self.client.force_authenticate(user=self.admin)
+        
+        # Create a regular user to manage
+        self.member = User.objects.create_user(
+            username='memberuser',
+            email='member@example.com',
+            password='MemberPass123!',
+            first_name='Member',
+            last_name='User'
+        )
+        self.detail_url = reverse('users:admin_user_detail', args=[self.member.pk])
+    
+    def test_get_user(self):
+        """Test retrieving a user without loading deferred fields."""
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.detail_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['username'], 'memberuser')
+        self.assertEqual(len(context), 1)
+    
+    def test_update_user(self):
+        """Test partially updating a user."""
+        response = self.client.patch(
+            self.detail_url,
+            {'first_name': 'Changed'},
+            format='json'
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['first_name'], 'Changed')
+        
+        self.member.refresh_from_db()
+        self.assertEqual(self.member.first_name, 'Changed')
+        self.assertTrue(self.member.check_password('MemberPass123!'))
+    
+    def test_update_user_with_unchanged_identity(self):
+        """Test that resubmitting the same username and email skips lookups."""
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.patch(
+                self.detail_url,
+                {'username': 'MemberUser', 'email': 'member@example.com'},
+                format='json'
+            )
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['username'], 'memberuser')
+        case_insensitive_lookups = [
+            q for q in context.captured_queries if 'LIKE' in q['sql'].upper()
+        ]
+        self.assertEqual(case_insensitive_lookups, [])
+    
+    def test_update_user_with_duplicate_email(self):
+        """Test updating a user with an email that is already taken."""
+        response = self.client.patch(
+            self.detail_url,
+            {'email': 'admin@example.com'},
+            format='json'
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('email', response.data)
+    
+    def test_update_missing_user(self):
+        """Test updating a user that does not exist."""
+        response = self.client.patch(
+            reverse('users:admin_user_detail', args=[self.member.pk + 100]),
+            {'first_name': 'Changed'},
+            format='json'
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+    
+    def test_delete_user(self):
+        """Test deleting a user."""
+        response = self.client.delete(self.detail_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(User.objects.filter(pk=self.member.pk).exists())
+    
+    def test_delete_self(self):
+        """Test that admins cannot delete their own account."""
+        response = self.client.delete(
+            reverse('users:admin_user_detail', args=[self.admin.pk])
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertTrue(User.objects.filter(pk=self.admin.pk).exists())
+    
+    def test_get_missing_user(self):
+        """Test retrieving a user that does not exist."""
+        response = self.client.get(
+            reverse('users:admin_user_detail', args=[self.member.pk + 100])
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,111 @@
+"""
+Token revocation helpers.
+
+This module supports two ways of revoking JWTs:
+
+- A denylist of revoked JWT IDs (jti) in Django's cache, for revoking
+  individual tokens. Each entry expires together with the token it
+  revokes, so the denylist never needs to be cleaned up. In production
+  the default cache should be Redis (see REDIS_URL in settings) so that
+  every worker shares the same denylist.
+- A per-user token version embedded in every token, for revoking all of
+  a user's tokens at once without any per-request lookup beyond loading
+  the user.
+"""
+
+import time
+
+from django.core.cache import cache
+from django.db.models import F
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import User
+
+
+DENYLIST_KEY_PREFIX = 'token_denylist:'
+
+TOKEN_VERSION_CLAIM = 'token_version'
+
+
+def get_denylist_key(token) -> str:
+    """
+    Build the cache key for a token's denylist entry.
+
+    Args:
+        token: A validated SimpleJWT token.
+
+    Returns:
+        str: The cache key for the token's jti.
+    """
+    return f"{DENYLIST_KEY_PREFIX}{token[api_settings.JTI_CLAIM]}"
+
+
+def deny_token(token) -> None:
+    """
+    Revoke a token until it expires.
+
+    Args:
+        token: A validated SimpleJWT token.
+    """
+    deny_tokens([token])
+
+
+def deny_tokens(tokens) -> None:
+    """
+    Revoke several tokens with a single cache write.
+
+    All entries share the timeout of the longest-lived token; keeping a
+    shorter-lived token's entry a little longer is harmless.
+
+    Args:
+        tokens: Validated SimpleJWT tokens.
+    """
+    now = time.time()
+    timeout = int(max((token['exp'] - now for token in tokens), default=0))
+
+    # Expired tokens are already rejected by signature validation
+    if timeout > 0:
+        cache.set_many(
+            {get_denylist_key(token): True for token in tokens},
+            timeout=timeout
+        )
+
+
+def is_token_denied(token) -> bool:
+    """
+    Check whether a token has been revoked.
+
+    Args:
+        token: A validated SimpleJWT token.
+
+    Returns:
+        bool: True if the token's jti is on the denylist.
+    """
+    return cache.get(get_denylist_key(token)) is not None
+
+
+def is_token_version_current(token, user: User) -> bool:
+    """
+    Check whether a token was issued for the user's current token version.
+
+    Tokens issued before the token version claim existed count as
+    version 0.
+
+    Args:
+        token: A validated SimpleJWT token.
+        user: The user the token was issued for.
+
+    Returns:
+        bool: True if the token has not been revoked by a version bump.
+    """
+    return token.get(TOKEN_VERSION_CLAIM, 0) == user.token_version
+
+
+def revoke_user_tokens(user: User) -> None:
+    """
+    Revoke every token issued to a user by incrementing their token version.
+
+    Args:
+        user: The user whose tokens should be revoked.
+    """
+    User.objects.filter(pk=user.pk).update(token_version=F('token_version') + 1)
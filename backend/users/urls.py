@@ -5,7 +5,7 @@ This module defines the URL patterns for user authentication endpoints:
 - /register/ : User registration
 - /login/ : User login (JWT token generation)
 - /profile/ : Get authenticated user's profile
-- /logout/ : Logout (blacklist refresh token)
+- /logout/ : Logout (revoke tokens)
 - /token/refresh/ : Refresh access token
 - /health/ : Health check endpoint
 - /admin/users/ : Admin - List all users (with search)
@@ -19,7 +19,7 @@ from .views import (
     RegisterView, 
     ProfileView, 
     LogoutView, 
-    HealthCheckView,
+    health_check,
     AdminUserListView,
     AdminUserDetailView,
 )
@@ -37,14 +37,14 @@ urlpatterns = [
     # Get authenticated user's profile
     path('profile/', ProfileView.as_view(), name='profile'),
     
-    # Logout (blacklist refresh token)
+    # Logout (revoke tokens via the denylist)
     path('logout/', LogoutView.as_view(), name='logout'),
     
     # Refresh access token
     path('token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     
     # Health check endpoint
-    path('health/', HealthCheckView.as_view(), name='health'),
+    path('health/', health_check, name='health'),
     
     # Admin endpoints
     path('admin/users/', AdminUserListView.as_view(), name='admin_user_list'),
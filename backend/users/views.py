@@ -4,25 +4,65 @@ API views for user management.
 This module contains RESTful API views for:
 - User registration
 - User profile retrieval
+- Logout (token revocation)
+- Admin user management
+- Health check (plain Django view)
 - Token refresh (handled by SimpleJWT)
 
-All views include proper error handling and logging.
+All views include logging; errors are converted to JSON responses by
+DRF's exception handler.
 """
 
+import json
 import logging
+from django.db.models import Q
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import quote_etag
+from django.views.decorators.http import require_safe
 from rest_framework import generics, status
 from rest_framework.response import Response
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
 
 from .models import User
-from .serializers import RegisterSerializer, UserSerializer
+from .pagination import UserPagination
+from .serializers import (
+    AdminUserSerializer,
+    LogoutSerializer,
+    RegisterSerializer,
+    UserSerializer,
+)
+from .tokens import deny_tokens, revoke_user_tokens
 
 
 logger = logging.getLogger(__name__)
 
+# Static health check payload, encoded once at import time
+HEALTH_CHECK_BODY = {
+    'status': 'healthy',
+    'message': 'User Authentication API is running.'
+}
+HEALTH_CHECK_JSON = json.dumps(HEALTH_CHECK_BODY).encode()
+
+# Columns read by AdminUserSerializer; everything else (password hash,
+# profile picture, date joined) is left out of admin queries.
+ADMIN_USER_FIELDS = (
+    'id',
+    'username',
+    'email',
+    'first_name',
+    'last_name',
+    'is_active',
+    'is_staff',
+    'is_superuser',
+    'created_at',
+    'updated_at',
+    'last_login',
+)
+
 
 class RegisterView(generics.CreateAPIView):
     """
@@ -59,39 +99,20 @@ class RegisterView(generics.CreateAPIView):
             Response: JSON response with user data or errors.
         """
         serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        user = serializer.save()
         
-        try:
-            serializer.is_valid(raise_exception=True)
-            user = serializer.save()
-            
-            # Return user data without password
-            response_serializer = UserSerializer(user)
-            
-            logger.info(f"User registered successfully: {user.username}")
-            
-            return Response(
-                {
-                    'message': 'User registered successfully.',
-                    'user': response_serializer.data
-                },
-                status=status.HTTP_201_CREATED
-            )
-            
-        except Exception as e:
-            logger.error(f"Registration error: {str(e)}")
-            
-            # If validation errors, serializer.errors will be populated
-            if hasattr(serializer, 'errors') and serializer.errors:
-                return Response(
-                    serializer.errors,
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            # Generic error response
-            return Response(
-                {'error': 'Registration failed. Please try again.'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        logger.info("User registered successfully: %s", user.username)
+        
+        # The registration serializer renders the same fields as
+        # UserSerializer (without passwords), so reuse its output
+        return Response(
+            {
+                'message': 'User registered successfully.',
+                'user': serializer.data
+            },
+            status=status.HTTP_201_CREATED
+        )
 
 
 class ProfileView(generics.RetrieveAPIView):
@@ -104,8 +125,14 @@ class ProfileView(generics.RetrieveAPIView):
     Headers Required:
         Authorization: Bearer <access_token>
     
+    Conditional Requests:
+        Responses carry an ETag derived from the user's `updated_at`.
+        Sending it back in `If-None-Match` returns 304 Not Modified with
+        no body until the profile changes.
+    
     Responses:
         - 200 OK: User profile data.
+        - 304 Not Modified: Profile unchanged since the given ETag.
         - 401 Unauthorized: Invalid or missing token.
     """
     
@@ -123,40 +150,48 @@ class ProfileView(generics.RetrieveAPIView):
     
     def retrieve(self, request, *args, **kwargs):
         """
-        Handle profile retrieval request.
+        Handle profile retrieval request with ETag support.
         
         Args:
             request: The HTTP request object.
             
         Returns:
-            Response: JSON response with user profile data.
+            Response: JSON response with user profile data, or an empty
+            304 response if the client's copy is current.
         """
-        try:
-            instance = self.get_object()
-            serializer = self.get_serializer(instance)
-            
-            logger.info(f"Profile retrieved for user: {instance.username}")
-            
-            return Response(serializer.data, status=status.HTTP_200_OK)
-            
-        except Exception as e:
-            logger.error(f"Profile retrieval error: {str(e)}")
-            
-            return Response(
-                {'error': 'Failed to retrieve profile.'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        instance = self.get_object()
+        etag = quote_etag(f"{instance.pk}-{instance.updated_at.timestamp()}")
+        
+        # Skip serialization entirely when the client's copy is current
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = super().retrieve(request, *args, **kwargs)
+        
+        response['ETag'] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ['Authorization'])
+        
+        return response
 
 
 class LogoutView(APIView):
     """
-    API view for user logout (token blacklisting).
+    API view for user logout (token revocation).
+    
+    The refresh token(s) and the access token used for the request are
+    added to the cache-backed denylist until they expire. With
+    `all_devices`, the user's token version is incremented instead, which
+    revokes every token issued to them.
     
     Endpoint: POST /api/auth/logout/
     Permission: IsAuthenticated (requires valid JWT token)
     
     Request Body:
-        - refresh (str): The refresh token to blacklist.
+        - refresh (str): The refresh token to revoke.
+        - refresh_tokens (list): Several refresh tokens to revoke at once
+          (e.g. one per device, at most 20). May be combined with `refresh`.
+        - all_devices (bool): Optional. Revoke all of the user's tokens;
+          `refresh` is not required in this case.
     
     Headers Required:
         Authorization: Bearer <access_token>
@@ -171,7 +206,7 @@ class LogoutView(APIView):
     
     def post(self, request):
         """
-        Handle logout request by blacklisting the refresh token.
+        Handle logout request by revoking the refresh and access tokens.
         
         Args:
             request: The HTTP request object.
@@ -179,73 +214,82 @@ class LogoutView(APIView):
         Returns:
             Response: JSON response confirming logout or error.
         """
-        try:
-            refresh_token = request.data.get('refresh')
-            
-            if not refresh_token:
-                return Response(
-                    {'error': 'Refresh token is required.'},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            # Blacklist the refresh token
-            token = RefreshToken(refresh_token)
-            token.blacklist()
+        # Keep `error` a plain string; the serializer would return a list
+        if not isinstance(request.data, dict):
+            return Response(
+                {'error': 'Request body must be a JSON object.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        serializer = LogoutSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        if serializer.validated_data['all_devices']:
+            revoke_user_tokens(request.user)
             
-            logger.info(f"User logged out: {request.user.username}")
+            logger.info("User logged out from all devices: %s", request.user.username)
             
             return Response(
-                {'message': 'Successfully logged out.'},
+                {'message': 'Successfully logged out from all devices.'},
                 status=status.HTTP_200_OK
             )
-            
-        except TokenError as e:
-            logger.warning(f"Logout token error: {str(e)}")
-            
+        
+        refresh_tokens = serializer.validated_data['refresh_tokens']
+        
+        if not refresh_tokens:
             return Response(
-                {'error': 'Invalid or expired token.'},
+                {'error': 'Refresh token is required.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
+        
+        try:
+            tokens = [RefreshToken(refresh_token) for refresh_token in refresh_tokens]
             
-        except Exception as e:
-            logger.error(f"Logout error: {str(e)}")
+        except TokenError as e:
+            logger.warning("Logout token error: %s", e)
             
             return Response(
-                {'error': 'Logout failed. Please try again.'},
+                {'error': 'Invalid or expired token.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
+        
+        if request.auth is not None:
+            tokens.append(request.auth)
+        
+        # Revoke every token with a single cache write
+        deny_tokens(tokens)
+        
+        logger.info("User logged out: %s", request.user.username)
+        
+        return Response(
+            {'message': 'Successfully logged out.'},
+            status=status.HTTP_200_OK
+        )
 
 
-class HealthCheckView(APIView):
+@require_safe
+def health_check(request):
     """
-    API view for health check (useful for monitoring).
+    Health check endpoint (useful for monitoring).
     
     Endpoint: GET /api/auth/health/
-    Permission: AllowAny (public endpoint)
+    Permission: None (public endpoint)
+    
+    This is a plain Django view rather than a DRF APIView, so probe
+    traffic skips authentication, permission, throttling, and content
+    negotiation entirely.
+    
+    Args:
+        request: The HTTP request object.
+        
+    Returns:
+        HttpResponse: JSON response indicating API health.
     
     Responses:
         - 200 OK: API is healthy.
+        - 405 Method Not Allowed: Any method other than GET/HEAD.
     """
-    
-    permission_classes = [AllowAny]
-    
-    def get(self, request):
-        """
-        Handle health check request.
-        
-        Args:
-            request: The HTTP request object.
-            
-        Returns:
-            Response: JSON response indicating API health.
-        """
-        return Response(
-            {
-                'status': 'healthy',
-                'message': 'User Authentication API is running.'
-            },
-            status=status.HTTP_200_OK
-        )
+    return HttpResponse(HEALTH_CHECK_JSON, content_type='application/json')
 
 
 class AdminUserListView(generics.ListAPIView):
@@ -257,60 +301,62 @@ class AdminUserListView(generics.ListAPIView):
     
     Query Parameters:
         - search (str): Search users by username, email, first_name, or last_name
+          (terms shorter than 3 characters match from the start of the field)
+        - page (int): Page number (default: 1)
+        - page_size (int): Users per page (default: 25, max: 100)
     
     Headers Required:
         Authorization: Bearer <access_token>
     
     Responses:
-        - 200 OK: List of users.
+        - 200 OK: Paginated list of users (count, next, previous, users).
         - 401 Unauthorized: Invalid or missing token.
         - 403 Forbidden: User is not staff.
     """
     
-    from rest_framework.permissions import IsAdminUser
-    from .serializers import AdminUserSerializer
-    
     serializer_class = AdminUserSerializer
     permission_classes = [IsAdminUser]
+    pagination_class = UserPagination
+    search_fields = ['username', 'email', 'first_name', 'last_name']
+    substring_search_min_length = 3
     
     def get_queryset(self):
         """
         Get queryset with optional search filtering.
         """
-        from django.db.models import Q
-        
-        queryset = User.objects.all().order_by('-created_at')
+        # The id tiebreaker keeps OFFSET pagination stable when several
+        # users share a created_at value
+        queryset = User.objects.only(*ADMIN_USER_FIELDS).order_by('-created_at', '-id')
         search = self.request.query_params.get('search', None)
         
         if search:
-            queryset = queryset.filter(
-                Q(username__icontains=search) |
-                Q(email__icontains=search) |
-                Q(first_name__icontains=search) |
-                Q(last_name__icontains=search)
-            )
+            # Short terms use prefix matching, which can be served from the
+            # column indexes; substring matching scans the whole table.
+            if len(search) < self.substring_search_min_length:
+                lookup = 'istartswith'
+            else:
+                lookup = 'icontains'
+            
+            query = Q()
+            for field in self.search_fields:
+                query |= Q(**{f'{field}__{lookup}': search})
+            
+            queryset = queryset.filter(query)
         
         return queryset
     
     def list(self, request, *args, **kwargs):
         """Handle list request with logging."""
-        try:
-            queryset = self.get_queryset()
-            serializer = self.get_serializer(queryset, many=True)
-            
-            logger.info(f"Admin {request.user.username} listed users (count: {queryset.count()})")
-            
-            return Response({
-                'count': queryset.count(),
-                'users': serializer.data
-            }, status=status.HTTP_200_OK)
-            
-        except Exception as e:
-            logger.error(f"Admin user list error: {str(e)}")
-            return Response(
-                {'error': 'Failed to retrieve user list.'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        response = super().list(request, *args, **kwargs)
+        
+        # Reuse the paginator's count rather than issuing another COUNT(*)
+        logger.info(
+            "Admin %s listed users (count: %s)",
+            request.user.username,
+            response.data['count']
+        )
+        
+        return response
 
 
 class AdminUserDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -336,69 +382,45 @@ class AdminUserDetailView(generics.RetrieveUpdateDestroyAPIView):
         - 404 Not Found: User not found.
     """
     
-    from rest_framework.permissions import IsAdminUser
-    from .serializers import AdminUserSerializer
-    
-    queryset = User.objects.all()
+    queryset = User.objects.only(*ADMIN_USER_FIELDS)
     serializer_class = AdminUserSerializer
     permission_classes = [IsAdminUser]
     lookup_field = 'pk'
     
-    def update(self, request, *args, **kwargs):
-        """Handle user update with logging."""
-        try:
-            instance = self.get_object()
-            partial = kwargs.pop('partial', False)
-            serializer = self.get_serializer(instance, data=request.data, partial=partial)
-            serializer.is_valid(raise_exception=True)
-            self.perform_update(serializer)
-            
-            logger.info(f"Admin {request.user.username} updated user: {instance.username}")
-            
-            return Response(serializer.data, status=status.HTTP_200_OK)
-            
-        except Exception as e:
-            logger.error(f"Admin user update error: {str(e)}")
-            if hasattr(serializer, 'errors') and serializer.errors:
-                return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-            return Response(
-                {'error': 'Failed to update user.'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+    def perform_update(self, serializer):
+        """Save the user and log the update."""
+        super().perform_update(serializer)
+        
+        logger.info(
+            "Admin %s updated user: %s",
+            self.request.user.username,
+            serializer.instance.username
+        )
     
     def destroy(self, request, *args, **kwargs):
         """Handle user deletion with safety checks."""
-        try:
-            instance = self.get_object()
-            
-            # Prevent admin from deleting themselves
-            if instance.pk == request.user.pk:
-                return Response(
-                    {'error': 'You cannot delete your own account.'},
-                    status=status.HTTP_403_FORBIDDEN
-                )
-            
-            # Prevent deleting superusers (only via Django admin)
-            if instance.is_superuser:
-                return Response(
-                    {'error': 'Superusers can only be deleted via Django admin.'},
-                    status=status.HTTP_403_FORBIDDEN
-                )
-            
-            username = instance.username
-            self.perform_destroy(instance)
-            
-            logger.info(f"Admin {request.user.username} deleted user: {username}")
-            
+        instance = self.get_object()
+        
+        # Prevent admin from deleting themselves
+        if instance.pk == request.user.pk:
             return Response(
-                {'message': f'User {username} has been deleted.'},
-                status=status.HTTP_200_OK
+                {'error': 'You cannot delete your own account.'},
+                status=status.HTTP_403_FORBIDDEN
             )
-            
-        except Exception as e:
-            logger.error(f"Admin user delete error: {str(e)}")
+        
+        # Prevent deleting superusers (only via Django admin)
+        if instance.is_superuser:
             return Response(
-                {'error': 'Failed to delete user.'},
-                status=status.HTTP_400_BAD_REQUEST
+                {'error': 'Superusers can only be deleted via Django admin.'},
+                status=status.HTTP_403_FORBIDDEN
             )
-
+        
+        username = instance.username
+        self.perform_destroy(instance)
+        
+        logger.info("Admin %s deleted user: %s", request.user.username, username)
+        
+        return Response(
+            {'message': f'User {username} has been deleted.'},
+            status=status.HTTP_200_OK
+        )
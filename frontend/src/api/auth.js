@@ -75,13 +75,17 @@ export const getProfile = async () => {
 // ============================================
 
 /**
- * Get all users (Admin only)
+ * Get a page of users (Admin only)
  * @param {string} [search] - Optional search query
- * @returns {Promise} Axios response with list of users
+ * @param {number} [page] - Page number (1-based)
+ * @returns {Promise} Axios response with count, next, previous and users
  */
-export const getUsers = async (search = '') => {
-    const params = search ? `?search=${encodeURIComponent(search)}` : '';
-    return api.get(`/admin/users/${params}`);
+export const getUsers = async (search = '', page = 1) => {
+    const params = new URLSearchParams();
+    if (search) params.set('search', search);
+    if (page > 1) params.set('page', page);
+    const query = params.toString();
+    return api.get(`/admin/users/${query ? `?${query}` : ''}`);
 };
 
 /**
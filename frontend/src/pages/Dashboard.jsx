@@ -12,6 +12,10 @@ const Dashboard = () => {
     // Admin state
     const [users, setUsers] = useState([]);
     const [searchQuery, setSearchQuery] = useState('');
+    const [page, setPage] = useState(1);
+    const [usersCount, setUsersCount] = useState(0);
+    const [hasNextPage, setHasNextPage] = useState(false);
+    const [hasPreviousPage, setHasPreviousPage] = useState(false);
     const [usersLoading, setUsersLoading] = useState(false);
     const [editingUser, setEditingUser] = useState(null);
     const [editForm, setEditForm] = useState({});
@@ -37,19 +41,27 @@ const Dashboard = () => {
         fetchProfile();
     }, [navigate]);
 
-    // Fetch users when admin and search changes
+    // Fetch users when admin, search or page changes
     useEffect(() => {
         if (isAdmin) {
             fetchUsers();
         }
-    }, [isAdmin, searchQuery]);
+    }, [isAdmin, searchQuery, page]);
 
     const fetchUsers = async () => {
         setUsersLoading(true);
         try {
-            const response = await getUsers(searchQuery);
+            const response = await getUsers(searchQuery, page);
             setUsers(response.data.users || []);
+            setUsersCount(response.data.count || 0);
+            setHasNextPage(Boolean(response.data.next));
+            setHasPreviousPage(Boolean(response.data.previous));
         } catch (err) {
+            // The current page no longer exists (e.g. after deleting its last user)
+            if (err.response?.status === 404 && page > 1) {
+                setPage(page - 1);
+                return;
+            }
             setMessage({ type: 'error', text: 'Failed to load users.' });
         } finally {
             setUsersLoading(false);
@@ -64,6 +76,7 @@ const Dashboard = () => {
 
     const handleSearch = (e) => {
         setSearchQuery(e.target.value);
+        setPage(1);
     };
 
     const handleEditClick = (userToEdit) => {
@@ -316,6 +329,27 @@ const Dashboard = () => {
                                     {users.length === 0 && (
                                         <p className="text-center py-8 text-gray-500">No users found.</p>
                                     )}
+
+                                    {/* Pagination */}
+                                    {(hasPreviousPage || hasNextPage) && (
+                                        <div className="flex items-center justify-between mt-4 text-sm text-gray-600">
+                                            <button
+                                                onClick={() => setPage(page - 1)}
+                                                disabled={!hasPreviousPage}
+                                                className="px-4 py-2 border border-gray-200 text-gray-700 rounded-xl hover:bg-gray-50 transition-colors disabled:opacity-50 disabled:cursor-not-allowed"
+                                            >
+                                                Previous
+                                            </button>
+                                            <span>Page {page} &middot; {usersCount} users</span>
+                                            <button
+                                                onClick={() => setPage(page + 1)}
+                                                disabled={!hasNextPage}
+                                                className="px-4 py-2 border border-gray-200 text-gray-700 rounded-xl hover:bg-gray-50 transition-colors disabled:opacity-50 disabled:cursor-not-allowed"
+                                            >
+                                                Next
+                                            </button>
+                                        </div>
+                                    )}
                                 </div>
                             )}
                         </div>